@@ -2,5 +2,6 @@
 
 from .processing import DataProcessor
 from .loader import DataLoader
+from .cache import ProcessedDataCache
 
-__all__ = ['DataProcessor', 'DataLoader']
\ No newline at end of file
+__all__ = ['DataProcessor', 'DataLoader', 'ProcessedDataCache']
\ No newline at end of file
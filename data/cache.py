@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+
+class ProcessedDataCache:
+    """Columnar (Parquet) cache for processed DataFrames, keyed on the source file"""
+
+    METADATA_KEY = b'processed_data_cache'
+    CACHE_VERSION = 2
+
+    def __init__(self, cache_dir: str = "data/.cache"):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def source_key(source_file: str) -> str:
+        """Resolved source path, so same-named files in different directories don't share a cache"""
+        return str(Path(source_file).resolve())
+
+    def _cache_prefix(self, source_file: str) -> str:
+        path_hash = hashlib.sha256(self.source_key(source_file).encode('utf-8')).hexdigest()[:12]
+        return f"{Path(source_file).stem}_{path_hash}"
+
+    def cache_path(self, source_file: str, max_rows: Optional[int] = None) -> Path:
+        """Location of the cached frame for a source file and row limit"""
+        rows = 'all' if max_rows is None else str(max_rows)
+        return self.cache_dir / f"{self._cache_prefix(source_file)}_{rows}.parquet"
+
+    @staticmethod
+    def file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """SHA-256 of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def read_metadata(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Read the cache metadata stored in the Parquet schema, without loading any data"""
+        try:
+            schema_metadata = pq.read_schema(cache_file).metadata or {}
+        except (OSError, pa.ArrowException):
+            return None
+
+        raw = schema_metadata.get(self.METADATA_KEY)
+        if not raw:
+            return None
+
+        # Corrupt or foreign metadata just marks the cache as stale
+        try:
+            metadata = json.loads(raw)
+        except ValueError:
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
+    def is_valid(self, source_file: str, metadata: Optional[Dict[str, Any]], max_rows: Optional[int] = None) -> bool:
+        """Check cache metadata against the current state of the source file"""
+        if not metadata or metadata.get('version') != self.CACHE_VERSION:
+            return False
+        if metadata.get('max_rows') != max_rows:
+            return False
+        if metadata.get('source_file') != self.source_key(source_file):
+            return False
+
+        stat = Path(source_file).stat()
+        if stat.st_size != metadata.get('source_size'):
+            return False
+        if stat.st_mtime_ns == metadata.get('source_mtime_ns'):
+            return True
+
+        # mtime changed (e.g. touched or re-copied): only a content change invalidates
+        return self.file_hash(source_file) == metadata.get('source_sha256')
+
+    def load(self, source_file: str, max_rows: Optional[int] = None, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """Return the cached frame if it is still valid for the source file, otherwise None"""
+        cache_file = self.cache_path(source_file, max_rows)
+        if not cache_file.exists():
+            return None
+
+        metadata = self.read_metadata(cache_file)
+        if not self.is_valid(source_file, metadata, max_rows):
+            print(f"Cache for {source_file} is stale, rebuilding")
+            return None
+
+        stat = Path(source_file).stat()
+        refresh_stamp = stat.st_mtime_ns != metadata.get('source_mtime_ns')
+        try:
+            table = pq.read_table(cache_file, columns=None if refresh_stamp else columns)
+            df = table.select(columns).to_pandas() if columns else table.to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            # The cache is only an optimisation: a damaged file means re-parse and rewrite
+            print(f"Cache for {source_file} is unreadable ({e}), rebuilding")
+            return None
+
+        if refresh_stamp:
+            # Content was unchanged (hash matched): record the new mtime so later runs skip the hash
+            metadata['source_mtime_ns'] = stat.st_mtime_ns
+            try:
+                self._write_table(table, cache_file, metadata)
+            except Exception as e:
+                print(f"Warning: could not refresh cache timestamp: {e}")
+        df.attrs['text_columns'] = metadata.get('text_columns', [])
+        print(f"Loaded {len(df)} cached records from {cache_file}")
+        return df
+
+    def save(self, df: pd.DataFrame, source_file: str, max_rows: Optional[int] = None, text_columns: Optional[List[str]] = None) -> Path:
+        """Write a processed frame to the cache, tagged with the source file fingerprint"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.cache_path(source_file, max_rows)
+        stat = Path(source_file).stat()
+
+        metadata = {
+            'version': self.CACHE_VERSION,
+            'source_file': self.source_key(source_file),
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'source_sha256': self.file_hash(source_file),
+            'max_rows': max_rows,
+            'text_columns': text_columns or [],
+        }
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        self._write_table(table, cache_file, metadata)
+
+        print(f"Cached {len(df)} processed records to {cache_file}")
+        return cache_file
+
+    def _write_table(self, table: pa.Table, cache_file: Path, metadata: Dict[str, Any]) -> None:
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata[self.METADATA_KEY] = json.dumps(metadata).encode('utf-8')
+        table = table.replace_schema_metadata(schema_metadata)
+
+        # Write to a unique temp file first so an interrupted run or a concurrent writer
+        # never leaves a half-written cache in place
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{cache_file.name}.", suffix='.tmp')
+        os.close(fd)
+        tmp_file = Path(tmp_name)
+        try:
+            pq.write_table(table, tmp_file, compression='zstd')
+            tmp_file.replace(cache_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def clear(self, source_file: Optional[str] = None) -> int:
+        """Remove cached frames (and leftover temp files), for one source file or all of them"""
+        if not self.cache_dir.exists():
+            return 0
+
+        # Cache files are named <stem>_<path hash>_<rows>.parquet[.<random>.tmp]
+        prefix = f"{self._cache_prefix(source_file)}_" if source_file else ''
+        removed = 0
+        for cache_file in [*self.cache_dir.glob("*.parquet"), *self.cache_dir.glob("*.tmp")]:
+            if not cache_file.name.startswith(prefix):
+                continue
+            cache_file.unlink()
+            removed += 1
+        return removed
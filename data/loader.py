@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import os
@@ -9,7 +11,7 @@ class DataLoader:
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
-        self.supported_formats = ['.csv', '.xlsx', '.xls']
+        self.supported_formats = ['.csv', '.xlsx', '.xls', '.parquet']
     
     def list_data_files(self) -> List[str]:
         """List all supported data files in the data directory"""
@@ -43,6 +45,19 @@ class DataLoader:
             print(f"Error loading {file_path}: {e}")
             raise
     
+    def load_parquet(self, file_path: str, columns: Optional[List[str]] = None, max_rows: int = None) -> pd.DataFrame:
+        """Load Parquet file (e.g. a processed-data cache), optionally only some columns or leading rows"""
+        try:
+            if max_rows is None:
+                df = pd.read_parquet(file_path, columns=columns)
+            else:
+                df = self._read_parquet_head(pq.ParquetFile(file_path), max_rows, columns)
+            print(f"Successfully loaded {len(df)} records from {file_path}")
+            return df
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            raise
+    
     def load_file(self, file_path: str, max_rows: int = None) -> pd.DataFrame:
         """Load file based on extension with optional row limit"""
         file_path = Path(file_path)
@@ -54,27 +69,108 @@ class DataLoader:
             return self.load_csv(str(file_path), max_rows=max_rows)
         elif file_path.suffix.lower() in ['.xlsx', '.xls']:
             return self.load_excel(str(file_path))
+        elif file_path.suffix.lower() == '.parquet':
+            return self.load_parquet(str(file_path), max_rows=max_rows)
         else:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
-        """Get information about a data file"""
-        df = self.load_file(file_path)
+    def count_csv_rows(self, file_path: str, encoding: str = 'utf-8', chunk_size: int = 100000) -> int:
+        """Count data rows by streaming a single column, so quoted multi-line fields count once"""
+        def count(enc: str) -> int:
+            reader = pd.read_csv(file_path, encoding=enc, usecols=[0], chunksize=chunk_size)
+            return sum(len(chunk) for chunk in reader)
+        
+        try:
+            return count(encoding)
+        except UnicodeDecodeError:
+            return count('latin-1')
+        except pd.errors.EmptyDataError:
+            return 0
+    
+    def get_file_info(self, file_path: str, sample_rows: int = 1000) -> Dict[str, Any]:
+        """Get information about a data file from its metadata and a row sample"""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File {file_path} not found")
+        
+        suffix = file_path.suffix.lower()
+        if suffix == '.parquet':
+            # Row count and per-column nulls come straight from the footer statistics
+            parquet_file = pq.ParquetFile(file_path)
+            total_records = parquet_file.metadata.num_rows
+            null_counts = self._parquet_null_counts(parquet_file)
+            df = self._read_parquet_head(parquet_file, sample_rows)
+        elif suffix == '.csv':
+            total_records = self.count_csv_rows(str(file_path))
+            df = self.load_csv(str(file_path), max_rows=sample_rows)
+            null_counts = None
+        else:
+            df = self.load_file(str(file_path))
+            total_records = len(df)
+            null_counts = df.isnull().sum().to_dict()
+        
+        sampled = len(df) < total_records
+        
+        memory_usage = df.memory_usage(deep=True).sum()
+        if sampled and len(df):
+            memory_usage = memory_usage / len(df) * total_records
         
         info = {
             'file_path': str(file_path),
-            'file_size_mb': round(Path(file_path).stat().st_size / (1024 * 1024), 2),
-            'total_records': len(df),
+            'file_size_mb': round(file_path.stat().st_size / (1024 * 1024), 2),
+            'total_records': total_records,
             'total_columns': len(df.columns),
             'columns': list(df.columns),
             'data_types': df.dtypes.to_dict(),
-            'memory_usage_mb': round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-            'null_counts': df.isnull().sum().to_dict(),
+            'memory_usage_mb': round(memory_usage / (1024 * 1024), 2),
+            'sample_rows': len(df),
+            'is_sampled': sampled,
             'sample_data': df.head(3).to_dict('records')
         }
         
+        # Exact null counts are only known for Parquet (footer statistics) and fully loaded files;
+        # for CSV they cover just the sampled rows, so they get their own key
+        if null_counts is not None:
+            info['null_counts'] = null_counts
+        else:
+            info['sample_null_counts'] = df.isnull().sum().to_dict()
+        
         return info
     
+    def _read_parquet_head(self, parquet_file: pq.ParquetFile, num_rows: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read only the leading rows of a Parquet file, batch by batch"""
+        batches = []
+        remaining = num_rows
+        if remaining > 0:
+            for batch in parquet_file.iter_batches(batch_size=remaining, columns=columns):
+                batches.append(batch.slice(0, remaining))
+                remaining -= len(batches[-1])
+                if remaining <= 0:
+                    break
+        
+        schema = parquet_file.schema_arrow
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns], metadata=schema.metadata)
+        return pa.Table.from_batches(batches, schema=schema).to_pandas()
+    
+    def _parquet_null_counts(self, parquet_file: pq.ParquetFile) -> Dict[str, Optional[int]]:
+        """Sum null counts per column from row-group statistics (None when not recorded)"""
+        metadata = parquet_file.metadata
+        counts: Dict[str, Optional[int]] = {}
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            for ci in range(row_group.num_columns):
+                column = row_group.column(ci)
+                name = column.path_in_schema
+                stats = column.statistics
+                if name in counts and counts[name] is None:
+                    continue
+                if stats is None or not stats.has_null_count:
+                    counts[name] = None
+                else:
+                    counts[name] = counts.get(name, 0) + stats.null_count
+        return counts
+    
     def convert_to_documents(self, df: pd.DataFrame, text_column: str = 'text_content') -> List[Dict[str, Any]]:
         """Convert DataFrame to list of documents for vector database"""
         if text_column not in df.columns:
@@ -1,16 +1,20 @@
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
+from .cache import ProcessedDataCache
 
 
 class DataProcessor:
     """Process and prepare data for ingestion into vector database"""
     
-    def __init__(self, input_dir: str = ".", output_dir: str = "data"):
+    def __init__(self, input_dir: str = ".", output_dir: str = "data", use_cache: bool = True, cache_min_rows: int = 100000):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache = ProcessedDataCache(self.output_dir / ".cache") if use_cache else None
+        # Row-limited reads below this size parse faster than the cache can fingerprint the source
+        self.cache_min_rows = cache_min_rows
     
     def combine_text_columns(self, df: pd.DataFrame, text_columns: List[str], separator: str = " | ") -> pd.Series:
         """Combine multiple columns into a single text column"""
@@ -19,27 +23,62 @@ class DataProcessor:
             combined_text = combined_text + separator + df[col].astype(str)
         return combined_text
     
-    def prepare_property_data(self, csv_file: str = "property_data.csv", max_rows: int = 10000) -> pd.DataFrame:
-        """Process property data and create text content for embedding (in-memory only)"""
+    def optimize_dtypes(self, df: pd.DataFrame, category_ratio: float = 0.5, exclude: Optional[List[str]] = None) -> pd.DataFrame:
+        """Shrink a DataFrame: low-cardinality text to categorical, integers to the smallest type that fits"""
+        exclude = set(exclude or [])
+        
+        for col in df.columns:
+            if col in exclude:
+                continue
+            series = df[col]
+            
+            # Floats stay float64: float32 loses precision on prices and coordinates
+            if pd.api.types.is_integer_dtype(series):
+                df[col] = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.infer_dtype(series, skipna=True) == 'string':
+                # Only pure-string columns: bool/mixed categories don't survive the Parquet round-trip
+                if len(series) and series.nunique(dropna=True) / len(series) <= category_ratio:
+                    df[col] = series.astype('category')
+        
+        return df
+    
+    def prepare_property_data(self, csv_file: str = "property_data.csv", max_rows: Optional[int] = 10000) -> pd.DataFrame:
+        """Process property data and create text content for embedding, reusing the columnar cache when valid"""
         input_file = self.input_dir / csv_file
         
         if not input_file.exists():
             raise FileNotFoundError(f"File {input_file} not found")
         
+        use_cache = self.cache is not None and (max_rows is None or max_rows >= self.cache_min_rows)
+        
+        if use_cache:
+            df = self.cache.load(str(input_file), max_rows=max_rows)
+            if df is not None:
+                print(f"Text columns used: {df.attrs.get('text_columns', [])}")
+                return df
+        
         print(f"Loading first {max_rows} rows from {csv_file}...")
         df = pd.read_csv(input_file, nrows=max_rows)
         
-        text_columns = [col for col in df.columns if df[col].dtype == 'object']
+        text_columns = list(df.select_dtypes(include=['object', 'string']).columns)
         available_columns = [col for col in text_columns if col in df.columns]
         
         if not available_columns:
             raise ValueError(f"None of the expected columns found: {text_columns}")
         
         df['text_content'] = self.combine_text_columns(df, available_columns)
+        df = self.optimize_dtypes(df, exclude=['text_content'])
+        df.attrs['text_columns'] = available_columns
         
         print(f"Processed {len(df)} records in memory")
         print(f"Text columns used: {available_columns}")
         
+        if use_cache:
+            try:
+                self.cache.save(df, str(input_file), max_rows=max_rows, text_columns=available_columns)
+            except Exception as e:
+                print(f"Warning: could not write processed data cache: {e}")
+        
         return df
     
     def clean_text_data(self, text: str) -> str:
@@ -54,8 +93,11 @@ class DataProcessor:
         return text
     
     def validate_processed_data(self, file_path: str) -> Dict[str, Any]:
-        """Validate the processed data file"""
-        df = pd.read_csv(file_path)
+        """Validate the processed data file (CSV or Parquet cache)"""
+        if Path(file_path).suffix.lower() == '.parquet':
+            df = pd.read_parquet(file_path)
+        else:
+            df = pd.read_csv(file_path)
         
         validation_report = {
             'total_records': len(df),